@@ -1,18 +1,111 @@
 # Function 1
 
-import pandas as pd
+import asyncio
+import contextvars
+import weakref
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
-from functools import lru_cache
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
+from urllib.parse import quote
+from cachetools import TTLCache
 from dotenv import load_dotenv
 import os
 
-# Load API key from environment variables
-load_dotenv('key_for_TM.env')
-api_key = os.getenv('CONSUMER_KEY')
+try:  # Optional shared L2 cache for attraction lookups
+    import msgpack
+    import redis
+except ImportError:
+    msgpack = redis = None
 
-@lru_cache(maxsize=100)  # Simple in-memory caching
-def find_attraction_info(identifier, identifier_type, api_key):
+# Number of times a failed request is retried, with exponential backoff (1s, 2s, 4s, ...)
+MAX_RETRIES = 5
+# Response statuses that are retried: rate limits and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# (connect, read) timeouts in seconds for every Ticketmaster request, so a hung socket cannot
+# block the caller indefinitely; a timed-out request is retried like any other network failure
+_DEFAULT_TIMEOUT = (3.05, 10)
+
+def _make_session(max_retries):
+    """
+    Builds a session whose pooled keep-alive connections are reused by every call made through it.
+    Rate limit (429) and server errors are retried up to 'max_retries' times by urllib3, which also
+    honors the Retry-After header.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=max_retries,
+            backoff_factor=1,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            raise_on_status=False  # Hand the last response back so callers can report its status
+        )
+    ))
+    return session
+
+# Shared session used by every Ticketmaster call that keeps the default retry count
+SESSION = _make_session(MAX_RETRIES)
+
+@lru_cache(maxsize=8)
+def _session_with_retries(max_retries):
+    """
+    Returns a session like SESSION that retries up to 'max_retries' times, for callers that
+    override MAX_RETRIES.
+    """
+    return _make_session(max_retries)
+
+# Discovery API endpoints; query strings are always passed as params so values get URL-encoded
+BASE_ATTRACTIONS = "https://app.ticketmaster.com/discovery/v2/attractions"
+BASE_EVENTS = "https://app.ticketmaster.com/discovery/v2/events.json"
+
+# Event searches are read in pages of EVENTS_PAGE_SIZE; the API serves at most the first
+# MAX_EVENT_RESULTS results of a search
+EVENTS_PAGE_SIZE = 200
+MAX_EVENT_RESULTS = 1000
+
+# API key of the current call, handed to the cached helpers so it stays out of their cache keys
+_REQUEST_API_KEY = contextvars.ContextVar('_REQUEST_API_KEY')
+# Retry count requested by the current call, or None for MAX_RETRIES; read by '_get_response'
+_REQUEST_MAX_RETRIES = contextvars.ContextVar('_REQUEST_MAX_RETRIES', default=None)
+
+# Event listings change within minutes, so successful event queries are only reused for two minutes
+_events_cache = TTLCache(maxsize=1024, ttl=120)
+_events_cache_lock = threading.Lock()
+
+def _cache_events(func):
+    """
+    Memoizes an events query in _events_cache, keyed on the function and its arguments.
+    Only successful results are stored, so a failed request is retried on the next call.
+    """
+    @wraps(func)
+    def wrapper(*args):
+        key = (func.__name__,) + args
+        with _events_cache_lock:
+            result = _events_cache.get(key)
+        if result is None:
+            result = func(*args)
+            if result[1] is None:
+                with _events_cache_lock:
+                    _events_cache[key] = result
+        return result
+    return wrapper
+
+# Lifetime in seconds of attraction lookups in the Redis cache (see _cached_fetch). Entries are
+# kept for L2_CACHE_STALE_TTL so that, once stale, they can be revalidated with their ETag.
+L2_CACHE_TTL = 3600
+L2_CACHE_STALE_TTL = 86400
+
+def find_attraction_info(identifier, identifier_type, api_key=None):
     """
     Queries the Ticketmaster API to retrieve information about an attraction, based on a specified identifier.
     This function can search for attractions using either their name or unique ID. It's particularly useful
@@ -26,8 +119,9 @@ def find_attraction_info(identifier, identifier_type, api_key):
         identifier_type (str): Specifies the type of the identifier. Acceptable values are 'name' or 'id'.
                                'name' will treat the identifier as the attraction's name, while 'id' will treat 
                                it as the attraction's unique ID.
-        api_key (str): API key for accessing the Ticketmaster API. This should be a valid API key provided by 
-                       Ticketmaster.
+        api_key (str, optional): API key for accessing the Ticketmaster API. This should be a valid API key 
+                                 provided by Ticketmaster. Defaults to the CONSUMER_KEY loaded from 
+                                 'key_for_TM.env'.
 
     Returns:
         pandas.DataFrame: A DataFrame containing detailed information about attractions that match the given 
@@ -42,64 +136,237 @@ def find_attraction_info(identifier, identifier_type, api_key):
 
     Example Usage:
         # To find information about an attraction by name:
-        >>> attraction_df, error_message = find_attraction_info('Taylor Swift', 'name', api_key)
+        >>> attraction_df, error_message = find_attraction_info('Taylor Swift', 'name', 'YOUR_API_KEY')
         >>> print(attraction_df)
 
         # To find information about an attraction by its unique ID:
-        >>> attraction_df, error_message = find_attraction_info('K8vZ9175Tr0', 'id', api_key)
+        >>> attraction_df, error_message = find_attraction_info('K8vZ9175Tr0', 'id', 'YOUR_API_KEY')
         >>> print(attraction_df)
 
     Note:
         The function implements a retry mechanism with exponential backoff to handle potential issues like 
         rate limits or network errors. This ensures reliability in fetching data from the Ticketmaster API.
+        Results are cached in-process, and in Redis for an hour when the TM_REDIS_URL environment variable
+        points at a server, so workers share lookups across restarts. The API key is not part of either
+        cache key, so rotating keys keeps existing entries.
         It is designed to work in conjunction with 'get_performer_events_1', providing the necessary attraction
-        ID to fetch detailed event information.
+        ID to fetch detailed event information. Use 'find_attraction_info_records' to skip building a DataFrame.
+    """
+    records, error_message = find_attraction_info_records(identifier, identifier_type, api_key)
+    return _attractions_frame(records), error_message
+
+def find_attraction_info_records(identifier, identifier_type, api_key=None):
+    """
+    Performs the same lookup as 'find_attraction_info', but returns the matched attractions as a list
+    of AttractionRow records (see 'extract_attraction_info') instead of a DataFrame, so pandas is not needed.
+
+    Returns:
+        tuple: A list of AttractionRow records and an error message (str) or None.
+
+    Raises:
+        ValueError: If the 'identifier_type' is not one of the expected values ('name' or 'id').
     """
     if identifier_type not in ['name', 'id']:
         raise ValueError("Invalid identifier type. Must be 'name' or 'id'.")
 
     if not identifier:
-        return pd.DataFrame(), "Identifier cannot be empty."
-    
-    if identifier_type == 'name':
-        link = f"https://app.ticketmaster.com/discovery/v2/attractions.json?keyword={identifier}&apikey={api_key}"
-    elif identifier_type == 'id':
-        link = f"https://app.ticketmaster.com/discovery/v2/attractions/{identifier}.json?apikey={api_key}"
+        return [], "Identifier cannot be empty."
 
-    # Implementing retry mechanism with exponential backoff
-    max_retries = 5
-    retry_delay = 1  # Starting delay in seconds
+    try:
+        records = _call_with_api_key(api_key, _find_attraction_info_cached, identifier, identifier_type)
+    except _LookupFailed as failure:
+        return [], str(failure)
+    return list(records), None
+
+@lru_cache(maxsize=1)
+def _default_api_key():
+    """
+    Loads the API key from 'key_for_TM.env' / the CONSUMER_KEY environment variable. Only runs
+    the first time a call is made without an explicit key, so importing the module stays free of file I/O.
+    """
+    load_dotenv('key_for_TM.env')
+    return os.getenv('CONSUMER_KEY')
+
+def _resolve_api_key(key):
+    """
+    Returns 'key', or the default API key when none is given.
+    """
+    return key or _default_api_key()
+
+def _call_with_api_key(key, func, *args):
+    """
+    Calls 'func' with the given API key, or the default key when none is given, exposed
+    through _REQUEST_API_KEY for the duration of the call.
+    """
+    token = _REQUEST_API_KEY.set(_resolve_api_key(key))
+    try:
+        return func(*args)
+    finally:
+        _REQUEST_API_KEY.reset(token)
+
+class _LookupFailed(Exception):
+    """
+    Raised by '_find_attraction_info_cached' with the error message of a failed lookup, so that
+    lru_cache does not store it and the next call retries.
+    """
 
-    for attempt in range(max_retries):
+@lru_cache(maxsize=256)  # In-process L1 cache, backed by Redis when TM_REDIS_URL is set
+def _find_attraction_info_cached(identifier, identifier_type):
+    """
+    Cached body of 'find_attraction_info', keyed on the identifier only. Only successful lookups
+    are cached: since the API key is not part of the key, caching a failure (e.g. a rejected key
+    or a network error) would hand it to every later caller.
+    """
+    link, params = _attraction_request(identifier, identifier_type, _REQUEST_API_KEY.get())
+    data, error_message = _cached_fetch(f"attractions:{identifier_type}:{identifier}", link, params)
+    if error_message is None:
+        # Process the response data; a tuple keeps callers from mutating the cached entry
         try:
-            response = requests.get(link)
-            if response.status_code == 429:  # Rate limit error code
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential increase in delay
-                continue
-            response.raise_for_status()  # Raise an error for bad HTTP status
-            break  # Break the loop if successful
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:
-                return pd.DataFrame(), f"Failed to fetch data after {max_retries} attempts. Error: {e}"
-            time.sleep(retry_delay)
-            retry_delay *= 2
-
-    # Handle the case where all retries fail
+            records, error_message = parse_attraction_data(data, identifier, identifier_type)
+        except Exception as err:
+            error_message = f"Other error occurred: {err}"
+    if error_message is not None:
+        raise _LookupFailed(error_message)
+    return tuple(records)
+
+def _attraction_request(identifier, identifier_type, key):
+    """
+    Returns the URL and query parameters that look up an attraction by name or ID.
+    """
+    if identifier_type == 'name':
+        return f"{BASE_ATTRACTIONS}.json", {'keyword': identifier, 'apikey': key}
+    return f"{BASE_ATTRACTIONS}/{quote(identifier, safe='')}.json", {'apikey': key}
+
+def _get_response(url, params=None, headers=None):
+    """
+    Requests a Ticketmaster URL through SESSION, which retries rate limits, server errors
+    and network failures with exponential backoff. A retry count set in _REQUEST_MAX_RETRIES
+    switches to a session with that count instead.
+
+    Returns:
+        tuple: The response or None, and an error message (str) or None.
+    """
+    max_retries = _REQUEST_MAX_RETRIES.get()
+    session = SESSION if max_retries is None else _session_with_retries(max_retries)
+    try:
+        response = session.get(url, params=params, headers=headers, timeout=_DEFAULT_TIMEOUT)
+        if response.status_code == 429:  # Still rate limited after all retries
+            return None, "Rate limit exceeded, try again later."
+        response.raise_for_status()  # Raise an error for bad HTTP status
+    except requests.exceptions.HTTPError as http_err:
+        return None, f"HTTP error occurred: {http_err}"
+    except requests.exceptions.RequestException as e:
+        return None, f"Failed to fetch data after {MAX_RETRIES if max_retries is None else max_retries} retries. Error: {e}"
+    return response, None
+
+def _decode_json(response):
+    """
+    Decodes the body of a successful response.
+
+    Returns:
+        tuple: The decoded JSON (dict) or None, and an error message (str) or None.
+    """
     if response.status_code != 200:
-        return pd.DataFrame(), f"Error fetching data: Status code {response.status_code}"
+        return None, f"Error fetching data: Status code {response.status_code}"
+
+    try:
+        return orjson.loads(response.content), None
+    except orjson.JSONDecodeError as err:
+        return None, f"Other error occurred: {err}"
+
+def _get_json(url, params=None):
+    """
+    Requests a Ticketmaster URL (see '_get_response') and decodes its JSON body.
+
+    Returns:
+        tuple: The decoded JSON (dict) or None, and an error message (str) or None.
+    """
+    response, error_message = _get_response(url, params)
+    if error_message is not None:
+        return None, error_message
+    return _decode_json(response)
+
+def _cached_fetch(cache_key, link, params=None):
+    """
+    Returns the decoded attractions payload for 'link', consulting the shared Redis cache first.
+    'cache_key' identifies the query without the API key, so every worker and every key share entries.
+    Successful responses are served from the cache for L2_CACHE_TTL seconds. After that, a stale
+    entry is revalidated with 'If-None-Match' and its ETag, so an unchanged attraction costs a
+    bodiless 304 response. Failures are never cached.
+
+    Returns:
+        tuple: The decoded JSON (dict) or None, and an error message (str) or None.
+    """
+    client = _get_redis_client()
+    entry = None
+    if client is not None:
+        try:
+            cached = client.get(cache_key)
+            if cached is not None:
+                entry = msgpack.unpackb(cached)
+        except redis.RedisError:
+            client = None  # Cache unavailable, fall back to the API
+    if not isinstance(entry, dict) or 'data' not in entry:
+        entry = None  # Missing, or written in an older format
+    elif entry['fresh_until'] > time.time():
+        return entry['data'], None
 
-    # Process the response data
-    data = response.json()
+    headers = {'If-None-Match': entry['etag']} if entry and entry['etag'] else None
+    response, error_message = _get_response(link, params, headers)
+    if error_message is not None:
+        return None, error_message
+
+    if response.status_code == 304 and entry is not None:
+        data = entry['data']
+    else:
+        data, error_message = _decode_json(response)
+        if error_message is not None:
+            return None, error_message
+
+    if client is not None:
+        entry = {
+            'data': data,
+            'etag': response.headers.get('ETag'),
+            'fresh_until': time.time() + L2_CACHE_TTL
+        }
+        try:
+            client.setex(cache_key, L2_CACHE_STALE_TTL, msgpack.packb(entry))
+        except redis.RedisError:
+            pass
+    return data, None
+
+@lru_cache(maxsize=1)
+def _get_redis_client():
+    """
+    Returns a Redis client for the shared L2 cache, or None when TM_REDIS_URL is not set
+    or the optional 'redis' and 'msgpack' packages are not installed.
+    """
+    redis_url = os.getenv('TM_REDIS_URL')
+    if not redis_url or redis is None or msgpack is None:
+        return None
+    return redis.Redis.from_url(redis_url)
+
+def parse_attraction_data(data, identifier, identifier_type):
+    """
+    Turns a decoded Ticketmaster attractions payload into the records returned by 'find_attraction_info_records'.
+    Shared by the synchronous and asynchronous lookups so both apply the same name matching.
+
+    Args:
+        data (dict): The decoded JSON body of an attractions search or attraction detail response.
+        identifier (str): The name or unique ID that was queried.
+        identifier_type (str): Either 'name' or 'id', matching the query that produced 'data'.
+
+    Returns:
+        tuple: A list of matched AttractionRow records and an error message (str) or None.
+    """
     matched_attractions = []
     error_message = None  # Initialize the error message as None
 
     if identifier_type == 'name':
         if '_embedded' in data and 'attractions' in data['_embedded']:
-            identifier_keywords = identifier.lower().split()
+            identifier_keywords = frozenset(identifier.lower().split())
             for attraction in data['_embedded']['attractions']:
-                attraction_name_keywords = attraction['name'].lower().split()
-                if all(keyword in attraction_name_keywords for keyword in identifier_keywords):
+                if identifier_keywords.issubset(attraction['name'].lower().split()):
                     matched_attractions.append(extract_attraction_info(attraction))
             if not matched_attractions:
                 error_message = "No matching attractions found with the name."
@@ -112,7 +379,13 @@ def find_attraction_info(identifier, identifier_type, api_key):
         else:
             error_message = "No matching attractions found by ID."
 
-    return pd.DataFrame(matched_attractions), error_message
+    return matched_attractions, error_message
+
+# DataFrame columns for the fields of AttractionRow, in the same order
+ATTRACTION_COLUMNS = ('name', 'ID', 'Ticketmaster Upcoming Events', 'Total Upcoming Events')
+
+# Lightweight per-attraction record: a tuple with named fields, no per-instance dict
+AttractionRow = namedtuple('AttractionRow', ['name', 'id', 'ticketmaster_upcoming_events', 'total_upcoming_events'])
 
 def extract_attraction_info(attraction): 
     """
@@ -126,28 +399,88 @@ def extract_attraction_info(attraction):
                            their associated values as provided by the Ticketmaster API.
 
     Returns:
-        dict: A dictionary containing formatted information about the attraction. Includes the attraction's
-              'name', 'ID', 'Ticketmaster Upcoming Events' count, and 'Total Upcoming Events' count. 
-              Defaults to 'N/A' for 'name' and 'ID' if they are not present in the input dictionary, 
-              and 0 for event counts if this information is not available.
+        AttractionRow: A record containing formatted information about the attraction. Includes the 
+              attraction's name, ID, Ticketmaster upcoming events count, and total upcoming events count,
+              which become the ATTRACTION_COLUMNS of the DataFrame. Defaults to 'N/A' for name and ID
+              if they are not present in the input dictionary, and 0 for event counts if this
+              information is not available.
 
     The function ensures that even if certain details are missing in the API response, the returned
-    dictionary still maintains a consistent structure, which is crucial for integrating the output 
+    record still maintains a consistent structure, which is crucial for integrating the output 
     into a DataFrame in the 'find_attraction_info' function.
     """
-    return {
-        'name': attraction.get('name', 'N/A'),
-        'ID': attraction.get('id', 'N/A'),
-        'Ticketmaster Upcoming Events': attraction.get('upcomingEvents', {}).get('ticketmaster', 0),
-        'Total Upcoming Events': attraction.get('upcomingEvents', {}).get('_total', 0)
-    }
+    upcoming_events = attraction.get('upcomingEvents', {})
+    return AttractionRow(
+        attraction.get('name', 'N/A'),
+        attraction.get('id', 'N/A'),
+        upcoming_events.get('ticketmaster', 0),
+        upcoming_events.get('_total', 0)
+    )
+
+def _attractions_frame(records):
+    """
+    Builds the DataFrame returned by the attraction lookups. pandas is imported here, on first
+    use, so the *_records functions work without it.
+    """
+    import pandas as pd
+    if not records:
+        return pd.DataFrame()
+    return pd.DataFrame.from_records(records, columns=ATTRACTION_COLUMNS)
+
+def find_attractions_bulk(identifiers, identifier_type, api_key=None):
+    """
+    Looks up several attractions at once. The API has no multi-attraction query (a 'keyword' is a
+    single free-text search), so each identifier is looked up concurrently through
+    'find_attraction_info_records', which also lets repeated identifiers hit its caches.
+
+    Args:
+    identifiers (iterable of str): Attraction names or IDs.
+    identifier_type (str): 'name' or 'id', applied to every identifier.
+    api_key (str, optional): API key for accessing the Ticketmaster API. Defaults to the CONSUMER_KEY
+                             loaded from 'key_for_TM.env'.
 
+    Returns:
+    tuple:
+        - dict: Maps each identifier to a DataFrame of its matching attractions, with the same columns
+          as 'find_attraction_info'. Identifiers without a match map to an empty DataFrame.
+        - str or None: The error message of every failed lookup, each prefixed with its identifier and
+          separated by '; ', or None if all lookups succeeded.
+
+    Raises:
+    ValueError: If the 'identifier_type' is not one of the expected values ('name' or 'id').
+
+    Example:
+    >>> results, error_message = find_attractions_bulk(['Taylor Swift', 'Coldplay'], 'name', 'YOUR_API_KEY')
+    >>> print(results['Coldplay'])
+    """
+    if identifier_type not in ['name', 'id']:
+        raise ValueError("Invalid identifier type. Must be 'name' or 'id'.")
+
+    identifiers = [identifier for identifier in dict.fromkeys(identifiers) if identifier]
+    if not identifiers:
+        return {}, "Identifiers cannot be empty."
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        lookups = list(executor.map(lambda identifier: find_attraction_info_records(identifier, identifier_type, api_key), identifiers))
+    results = {identifier: _attractions_frame(records) for identifier, (records, _) in zip(identifiers, lookups)}
+    errors = [f"{identifier}: {error}" for identifier, (_, error) in zip(identifiers, lookups) if error is not None]
+    return results, '; '.join(errors) or None
+
+def clear_cache():
+    """
+    Empties the in-process caches of 'find_attraction_info', 'get_performer_events_1' and
+    'fetch_filtered_events'.
+    Entries in the Redis cache are left to expire on their own.
+    """
+    _find_attraction_info_cached.cache_clear()
+    with _events_cache_lock:
+        _events_cache.clear()
 
 
 
 # Function 2
 
-def get_performer_events_1(attraction_id, api_key, max_retries=5):
+def get_performer_events_1(attraction_id, api_key=None, max_retries=None):
     """
     Retrieves detailed event information for a performer based on their Ticketmaster attraction ID. 
     The function queries the Ticketmaster API and returns a structured DataFrame containing 
@@ -158,8 +491,9 @@ def get_performer_events_1(attraction_id, api_key, max_retries=5):
 
     Args:
     attraction_id (str): The unique ID of the performer's attraction as recognized by Ticketmaster.
-    api_key (str): API key for accessing the Ticketmaster API.
-    max_retries (int): Maximum number of retry attempts for the API request in case of failure.
+    api_key (str, optional): API key for accessing the Ticketmaster API. Defaults to the CONSUMER_KEY
+                             loaded from 'key_for_TM.env'.
+    max_retries (int, optional): Number of times a failed request is retried. Defaults to MAX_RETRIES.
 
     Returns:
     tuple: 
@@ -168,53 +502,87 @@ def get_performer_events_1(attraction_id, api_key, max_retries=5):
         - str or None: An error message if the request fails, or None if it is successful.
 
     The DataFrame will be empty if no events are found for the performer. The function 
-    retries the request up to 'max_retries' times in case of a rate limit error (HTTP 429) 
-    or other network issues, with an increasing delay between retries.
+    retries the request up to 'max_retries' times in case of a rate limit error (HTTP 429), 
+    a server error or other network issues, with an increasing delay between retries.
 
     Example:
-    >>> performer_events_df, error_message = get_performer_events_1('K8vZ9175Tr0', 'YOUR_API_KEY', max_retries=3)
+    >>> performer_events_df, error_message = get_performer_events_1('K8vZ9175Tr0', 'YOUR_API_KEY')
     >>> print(performer_events_df)
 
     Note:
     If the request fails after all retries, or if another error occurs, the function 
-    returns an empty DataFrame and an error message.
-    """    
-    events_url = f"https://app.ticketmaster.com/discovery/v2/events.json?apikey={api_key}&attractionId={attraction_id}"
-    retry_delay = 1  # Start with a delay of 1 second
+    returns an empty DataFrame and an error message. Successful results are cached in-process
+    per attraction ID for two minutes; the API key is not part of the cache key. Use
+    'get_performer_events_records' to skip building a DataFrame.
+    """
+    token = _REQUEST_MAX_RETRIES.set(max_retries)
+    try:
+        rows, error_message = get_performer_events_records(attraction_id, api_key)
+    finally:
+        _REQUEST_MAX_RETRIES.reset(token)
+    return _performer_events_frame(rows), error_message
 
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(events_url)
-            
-            # Check for rate limit before proceeding
-            if response.status_code == 429:
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-                else:
-                    return pd.DataFrame(), "Rate limit exceeded, try again later."
-
-            response.raise_for_status()  # Raises an exception for HTTP errors
-
-            events_data = response.json().get('_embedded', {}).get('events', [])
-            if not events_data:
-                return pd.DataFrame(), "No events found for this performer."
-
-            # Process events data
-            events_info = []
-            for event in events_data:
-                event_info = extract_event_info(event)
-                events_info.append(event_info)
-
-            return pd.DataFrame(events_info), None
-
-        except requests.HTTPError as http_err:
-            return pd.DataFrame(), f"HTTP error occurred: {http_err}"
-        except Exception as err:
-            return pd.DataFrame(), f"Other error occurred: {err}"
+def get_performer_events_records(attraction_id, api_key=None):
+    """
+    Performs the same query as 'get_performer_events_1', but returns the events as a list of EventRow
+    records (see 'extract_event_info') instead of a DataFrame, so pandas is not needed. The
+    'Average Price' column is derived when the DataFrame is built and is not part of the records.
+
+    Returns:
+    tuple: A list of EventRow records and an error message (str) or None.
+    """
+    rows, error_message = _call_with_api_key(api_key, _get_performer_events_cached, attraction_id)
+    return list(rows), error_message
+
+@_cache_events
+def _get_performer_events_cached(attraction_id):
+    """
+    Cached body of 'get_performer_events_1', keyed on the attraction ID only.
+    """
+    params = {'apikey': _REQUEST_API_KEY.get(), 'attractionId': attraction_id}
+    data, error_message = _get_json(BASE_EVENTS, params=params)
+    if error_message is not None:
+        return (), error_message
+    try:
+        rows, error_message = parse_performer_events_data(data)
+    except Exception as err:
+        return (), f"Other error occurred: {err}"
+    return tuple(rows), error_message
+
+def parse_performer_events_data(data):
+    """
+    Extracts the event rows returned by 'get_performer_events_records' from a decoded API payload.
+
+    Args:
+    data (dict): The decoded JSON body of an events search response.
+
+    Returns:
+    tuple: A list of EventRow records and an error message (str) or None.
+    """
+    events_data = data.get('_embedded', {}).get('events', [])
+    if not events_data:
+        return [], "No events found for this performer."
 
-    return pd.DataFrame(), "Failed to fetch events after retries"
+    # Process events data in a single C-level loop
+    return list(map(extract_event_info, events_data)), None
+
+# DataFrame columns for the fields of EventRow, in the same order
+EVENT_COLUMNS = (
+    'Event Name', 'Event ID', 'Start Date', 'Start Time', 'Venue', 'Venue ID', 'City', 'Country',
+    'publicsale_start', 'publicsale_end', 'presale_start', 'presale_end',
+    'Min Price', 'Max Price'
+)
+
+# Numeric event columns; declared so prices are stored as float64 (missing prices as NaN)
+# instead of object columns holding Python floats and None
+EVENT_DTYPES = {'Min Price': 'float64', 'Max Price': 'float64'}
+
+# Lightweight per-event record: a tuple with named fields, no per-instance dict
+EventRow = namedtuple('EventRow', [
+    'event_name', 'event_id', 'start_date', 'start_time', 'venue', 'venue_id', 'city', 'country',
+    'publicsale_start', 'publicsale_end', 'presale_start', 'presale_end',
+    'min_price', 'max_price'
+])
 
 def extract_event_info(event):
     """
@@ -224,47 +592,73 @@ def extract_event_info(event):
     event (dict): A dictionary containing details of a single event.
 
     Returns:
-    dict: A dictionary with extracted event information.
-    """
-    min_price, max_price = None, None
-    if 'priceRanges' in event:
-        prices = event['priceRanges'][0]
-        min_price = prices.get('min')
-        max_price = prices.get('max')
-
-    avg_price = (min_price + max_price) / 2 if min_price and max_price else None
-
-    # Extracting venue ID
-    venue_id = event.get('_embedded', {}).get('venues', [{}])[0].get('id', 'N/A')
-
-    return {
-        'Event Name': event.get('name'),
-        'Event ID': event.get('id'),
-        'Start Date': event.get('dates', {}).get('start', {}).get('localDate'),
-        'Start Time': event.get('dates', {}).get('start', {}).get('localTime'),
-        'Venue': event.get('_embedded', {}).get('venues', [{}])[0].get('name'),
-        'Venue ID': venue_id,  # Including Venue ID
-        'City': event.get('_embedded', {}).get('venues', [{}])[0].get('city', {}).get('name'),
-        'Country': event.get('_embedded', {}).get('venues', [{}])[0].get('country', {}).get('name'),
-        'publicsale_start': event.get('sales', {}).get('public', {}).get('startDateTime'),
-        'publicsale_end': event.get('sales', {}).get('public', {}).get('endDateTime'),
-        'presale_start': event.get('sales', {}).get('presale', [{}])[0].get('startDateTime'),
-        'presale_end': event.get('sales', {}).get('presale', [{}])[0].get('endDateTime'),
-        'Min Price': min_price,
-        'Max Price': max_price,
-        'Average Price': avg_price
-    }
+    EventRow: The extracted event information; its fields map to EVENT_COLUMNS.
+    """
+    prices = (event.get('priceRanges') or [{}])[0]
+    min_price = prices.get('min')
+    max_price = prices.get('max')
+
+    # Resolve each nested section once instead of walking it again for every field
+    venue = ((event.get('_embedded') or {}).get('venues') or [{}])[0]
+    start = (event.get('dates') or {}).get('start') or {}
+    sales = event.get('sales') or {}
+    public = sales.get('public') or {}
+    presale = (sales.get('presale') or [{}])[0]
+
+    return EventRow(
+        event.get('name'),
+        event.get('id'),
+        start.get('localDate'),
+        start.get('localTime'),
+        venue.get('name'),
+        venue.get('id', 'N/A'),  # Including Venue ID
+        (venue.get('city') or {}).get('name'),
+        (venue.get('country') or {}).get('name'),
+        public.get('startDateTime'),
+        public.get('endDateTime'),
+        presale.get('startDateTime'),
+        presale.get('endDateTime'),
+        min_price,
+        max_price
+    )
+
+def _performer_events_frame(rows):
+    """
+    Builds the DataFrame returned by 'get_performer_events_1', adding the 'Average Price' column.
+    """
+    df = _events_frame(rows, EVENT_COLUMNS, EVENT_DTYPES)
+    if not df.empty:
+        # One vectorized pass; NaN when either price is missing, while a price of 0 still counts
+        df['Average Price'] = (df['Min Price'] + df['Max Price']) * 0.5
+    return df
+
+def _events_frame(rows, columns, dtypes=None):
+    """
+    Builds an events DataFrame from extracted records. The records are transposed into one list per
+    column first, so pandas does not have to pivot them, and columns listed in 'dtypes' are created
+    with that dtype directly. pandas is imported here, on first use, so the *_records functions
+    work without it.
+    """
+    import pandas as pd
+    if not rows:
+        return pd.DataFrame()
+    dtypes = dtypes or {}
+    return pd.DataFrame({
+        name: pd.array(values, dtype=dtypes[name]) if name in dtypes else list(values)
+        for name, values in zip(columns, zip(*rows))
+    }, copy=False)
 
 
 
 # Function 3
 
-def fetch_filtered_events(api_key, start_date=None, end_date=None, city=None, state_code=None, country_code=None): 
+def fetch_filtered_events(api_key=None, start_date=None, end_date=None, city=None, state_code=None, country_code=None): 
     """
     Retrieves a list of events from the Ticketmaster API based on specified filtering criteria.
 
     Args:
-    api_key (str): API key for accessing the Ticketmaster API.
+    api_key (str, optional): API key for accessing the Ticketmaster API. Defaults to the CONSUMER_KEY
+                             loaded from 'key_for_TM.env'.
     start_date (str, optional): The start date for filtering events in ISO 8601 format (YYYY-MM-DDThh:mm:ssZ).
                                 Defaults to None, which means no start date filter is applied.
     end_date (str, optional): The end date for filtering events in ISO 8601 format (YYYY-MM-DDThh:mm:ssZ).
@@ -280,69 +674,407 @@ def fetch_filtered_events(api_key, start_date=None, end_date=None, city=None, st
            the request is successful.
 
     This function handles rate limits by implementing a retry mechanism with exponential backoff.
-    In case of rate limit errors, it retries the request up to a maximum of five times with increasing delays.
+    In case of rate limit or server errors, it retries the request up to MAX_RETRIES times with increasing delays.
+    All result pages are collected, up to the API limit of MAX_EVENT_RESULTS events; after the first
+    page reveals the page count, the remaining pages are requested concurrently.
 
     Example:
-    >>> events_df, error_message = fetch_filtered_events(api_key, city="New York", start_date="2023-01-01T00:00:00Z", end_date="2023-12-31T00:00:00Z")
+    >>> events_df, error_message = fetch_filtered_events('YOUR_API_KEY', city="New York", start_date="2023-01-01T00:00:00Z", end_date="2023-12-31T00:00:00Z")
     >>> print(events_df)
     
     Note:
-    The function raises HTTP errors and other exceptions if the request fails after all retry attempts.
+    If the request fails after all retry attempts, the function returns an empty DataFrame and an error message.
+    Successful results are cached in-process per set of filters for two minutes; the API key is not
+    part of the cache key. Use 'fetch_filtered_events_records' to skip building a DataFrame.
+    """
+    rows, error_message = fetch_filtered_events_records(api_key, start_date, end_date, city, state_code, country_code)
+    return _events_frame(rows, FILTERED_EVENT_COLUMNS), error_message
+
+def fetch_filtered_events_records(api_key=None, start_date=None, end_date=None, city=None, state_code=None, country_code=None):
+    """
+    Performs the same query as 'fetch_filtered_events', but returns the events as a list of
+    FilteredEventRow records (see 'extract_filtered_event_info') instead of a DataFrame, so pandas
+    is not needed.
+
+    Returns:
+    tuple: A list of FilteredEventRow records and an error message (str) or None.
+    """
+    rows, error_message = _call_with_api_key(api_key, _fetch_filtered_events_cached, start_date, end_date, city, state_code, country_code)
+    return list(rows), error_message
+
+@_cache_events
+def _fetch_filtered_events_cached(start_date, end_date, city, state_code, country_code):
+    """
+    Cached body of 'fetch_filtered_events', keyed on the filters only.
     """
-    base_url = "https://app.ticketmaster.com/discovery/v2/events.json"
     params = {
-        'apikey': api_key,
+        'apikey': _REQUEST_API_KEY.get(),
         'startDateTime': start_date,
         'endDateTime': end_date,
         'city': city,
         'stateCode': state_code,
-        'countryCode': country_code
+        'countryCode': country_code,
+        'size': EVENTS_PAGE_SIZE,
+        'page': 0
     }
-    
-    max_retries = 5
+    data, error_message = _get_json(BASE_EVENTS, params=params)
+    if error_message is not None:
+        return (), error_message
+
+    try:
+        pages = [data]
+        total_pages = _event_page_count(data)
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                responses = list(executor.map(lambda page: _get_json(BASE_EVENTS, params={**params, 'page': page}), range(1, total_pages)))
+            for page_data, error_message in responses:
+                if error_message is not None:
+                    return (), error_message
+                pages.append(page_data)
+
+        rows, error_message = parse_filtered_events_data(_merge_event_pages(pages))
+    except Exception as err:
+        return (), f"Other error occurred: {err}"
+    return tuple(rows), error_message
+
+def _event_page_count(data):
+    """
+    Returns how many pages of an events search to read, given its first page.
+    """
+    total_pages = (data.get('page') or {}).get('totalPages') or 1
+    return min(total_pages, MAX_EVENT_RESULTS // EVENTS_PAGE_SIZE)
+
+def _merge_event_pages(pages):
+    """
+    Combines the events of several result pages into a single events payload.
+    """
+    return {'_embedded': {'events': [
+        event for page in pages for event in page.get('_embedded', {}).get('events', [])
+    ]}}
+
+def parse_filtered_events_data(data):
+    """
+    Extracts the event rows returned by 'fetch_filtered_events_records' from a decoded API payload.
+
+    Args:
+    data (dict): The decoded JSON body of an events search response.
+
+    Returns:
+    tuple: A list of FilteredEventRow records and an error message (str) or None.
+    """
+    events_data = data.get('_embedded', {}).get('events', [])
+    if not events_data:
+        return [], "No events found for the given criteria."
+
+    return list(map(extract_filtered_event_info, events_data)), None
+
+# DataFrame columns for the fields of FilteredEventRow, in the same order
+FILTERED_EVENT_COLUMNS = (
+    'ID', 'Venue ID', 'Start DateTime', 'End DateTime', 'City', 'State Code', 'Country Code',
+    'Onsale Start DateTime', 'Onsale End DateTime', 'Local Start DateTime', 'Local End DateTime',
+    'Start End DateTime'
+)
+
+FilteredEventRow = namedtuple('FilteredEventRow', [
+    'id', 'venue_id', 'start_datetime', 'end_datetime', 'city', 'state_code', 'country_code',
+    'onsale_start_datetime', 'onsale_end_datetime', 'local_start_date', 'local_end_date', 'timezone'
+])
+
+def extract_filtered_event_info(event):
+    """
+    Extracts the scheduling and location fields of a single event for 'fetch_filtered_events'.
+
+    Args:
+    event (dict): A dictionary containing details of a single event.
+
+    Returns:
+    FilteredEventRow: The extracted event information; its fields map to FILTERED_EVENT_COLUMNS.
+    """
+    venue = ((event.get('_embedded') or {}).get('venues') or [{}])[0]
+    dates = event.get('dates') or {}
+    start = dates.get('start') or {}
+    end = dates.get('end') or {}
+    public = (event.get('sales') or {}).get('public') or {}
+
+    return FilteredEventRow(
+        event.get('id'),
+        venue.get('id'),
+        start.get('dateTime'),
+        end.get('dateTime'),
+        (venue.get('city') or {}).get('name'),
+        (venue.get('state') or {}).get('stateCode'),
+        (venue.get('country') or {}).get('countryCode'),
+        public.get('startDateTime'),
+        public.get('endDateTime'),
+        start.get('localDate'),
+        end.get('localDate'),
+        dates.get('timezone')
+    )
+
+
+
+# Async variants
+
+# One aiohttp session and rate limiter per event loop; neither can be shared across loops
+_ASYNC_SESSIONS = weakref.WeakKeyDictionary()
+_ASYNC_LIMITERS = weakref.WeakKeyDictionary()
+# Number of 'async_session' blocks open per event loop; the session is closed when it drops to 0
+_ASYNC_SESSION_USERS = weakref.WeakKeyDictionary()
+
+# Maximum number of Ticketmaster requests in flight at once, per event loop
+MAX_CONCURRENT_REQUESTS = 5
+
+class _RateLimiter:
+    """
+    Caps the number of in-flight requests and pauses all of them when Ticketmaster reports
+    that the quota is spent, so concurrent callers do not trigger a burst of 429 responses.
+    """
+
+    def __init__(self, max_concurrency):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._resume_at = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+
+    def update(self, headers):
+        """
+        Reads the rate limit headers of a response and delays every later request accordingly.
+        'Retry-After' gives the wait in seconds; an exhausted remaining count waits out the
+        current one-second quota window.
+        """
+        pause = 0.0
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            pause = float(retry_after)
+        remaining = headers.get('X-RateLimit-Remaining', headers.get('Rate-Limit-Available'))
+        if remaining is not None and remaining.isdigit() and int(remaining) == 0:
+            pause = max(pause, 1.0)
+        if pause:
+            self._resume_at = max(self._resume_at, time.monotonic() + pause)
+
+def _get_session():
+    """
+    Returns the aiohttp session bound to the running event loop, creating it on first use.
+    The connector keeps connections to Ticketmaster alive between concurrent requests.
+    aiohttp is imported here, on first use, so the synchronous functions work without it.
+    """
+    import aiohttp
+    loop = asyncio.get_running_loop()
+    session = _ASYNC_SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(connect=_DEFAULT_TIMEOUT[0], sock_read=_DEFAULT_TIMEOUT[1])
+        )
+        _ASYNC_SESSIONS[loop] = session
+    return session
+
+def _get_limiter():
+    """
+    Returns the rate limiter bound to the running event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _ASYNC_LIMITERS.get(loop)
+    if limiter is None:
+        limiter = _RateLimiter(MAX_CONCURRENT_REQUESTS)
+        _ASYNC_LIMITERS[loop] = limiter
+    return limiter
+
+async def close_async_session():
+    """
+    Closes the aiohttp session of the running event loop. 'async_session' calls this on exit.
+    """
+    session = _ASYNC_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+@asynccontextmanager
+async def async_session():
+    """
+    Keeps the aiohttp session of the running event loop open for the duration of the block, so
+    that several awaited calls reuse its connections. The session is closed on exit once no other
+    block or call on the loop still uses it. The async functions of this module open such a block
+    themselves, so a single call never leaks its session.
+
+    Example:
+    >>> async def main():
+    ...     async with async_session():
+    ...         artist_df, error_message = await find_attraction_info_async('Taylor Swift', 'name', 'YOUR_API_KEY')
+    ...         events_df, error_message = await get_performer_events_1_async(artist_df['ID'][0], 'YOUR_API_KEY')
+    >>> asyncio.run(main())
+    """
+    loop = asyncio.get_running_loop()
+    _ASYNC_SESSION_USERS[loop] = _ASYNC_SESSION_USERS.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _ASYNC_SESSION_USERS[loop] -= 1
+        if not _ASYNC_SESSION_USERS[loop]:
+            del _ASYNC_SESSION_USERS[loop]
+            await close_async_session()
+
+def _uses_async_session(func):
+    """
+    Runs the decorated coroutine function inside an 'async_session' block.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with async_session():
+            return await func(*args, **kwargs)
+    return wrapper
+
+async def _get_json_async(url, params=None, max_retries=None):
+    """
+    Fetches and decodes a JSON document with the same retry and exponential backoff policy
+    as the synchronous functions: rate limits, the server errors in RETRY_STATUS_CODES and
+    network failures are retried up to 'max_retries' times (MAX_RETRIES when None) after the
+    first attempt. At most MAX_CONCURRENT_REQUESTS calls hit the API at once.
+
+    Returns:
+    tuple: The decoded JSON (dict) or None, and an error message (str) or None.
+    """
+    import aiohttp
+    if params is not None:
+        # aiohttp rejects None values, requests silently drops them
+        params = {key: value for key, value in params.items() if value is not None}
+    if max_retries is None:
+        max_retries = MAX_RETRIES
     retry_delay = 1  # Starting delay in seconds
-    response = None  # Initialize response
 
-    for attempt in range(max_retries):
+    limiter = _get_limiter()
+
+    for attempt in range(max_retries + 1):
         try:
-            response = requests.get(base_url, params=params)
-            response.raise_for_status()  # Raises an exception for HTTP errors
-            break  # Exit the loop if the request is successful
-        except requests.exceptions.HTTPError as http_err:
-            if response and response.status_code == 429:  # Rate limit error code
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential increase in delay
-                continue
-            return pd.DataFrame(), f"HTTP error occurred: {http_err}"
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:
-                return pd.DataFrame(), f"Failed to fetch data after {max_retries} attempts. Error: {e}"
-            time.sleep(retry_delay)
-            retry_delay *= 2
-
-    if response is None or response.status_code != 200:
-        return pd.DataFrame(), "No successful response received from the API."
-
-    events_data = response.json().get('_embedded', {}).get('events', [])
-    if not events_data:
-        return pd.DataFrame(), "No events found for the given criteria."
-
-    events_info = []
-    for event in events_data:
-            event_info = {
-                'ID': event.get('id'),
-                'Venue ID': event.get('_embedded', {}).get('venues', [{}])[0].get('id'),
-                'Start DateTime': event.get('dates', {}).get('start', {}).get('dateTime'),
-                'End DateTime': event.get('dates', {}).get('end', {}).get('dateTime'),
-                'City': event.get('_embedded', {}).get('venues', [{}])[0].get('city', {}).get('name'),
-                'State Code': event.get('_embedded', {}).get('venues', [{}])[0].get('state', {}).get('stateCode'),
-                'Country Code': event.get('_embedded', {}).get('venues', [{}])[0].get('country', {}).get('countryCode'),
-                'Onsale Start DateTime': event.get('sales', {}).get('public', {}).get('startDateTime'),
-                'Onsale End DateTime': event.get('sales', {}).get('public', {}).get('endDateTime'),
-                'Local Start DateTime': event.get('dates', {}).get('start', {}).get('localDate'),
-                'Local End DateTime': event.get('dates', {}).get('end', {}).get('localDate'),
-                'Start End DateTime': event.get('dates', {}).get('timezone')
-            }
-            events_info.append(event_info)
-
-    return pd.DataFrame(events_info), None
+            async with limiter, _get_session().get(url, params=params) as response:
+                limiter.update(response.headers)
+                if response.status not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    try:
+                        return orjson.loads(await response.read()), None
+                    except orjson.JSONDecodeError as err:
+                        return None, f"Other error occurred: {err}"
+                if attempt == max_retries:
+                    if response.status == 429:
+                        return None, "Rate limit exceeded, try again later."
+                    response.raise_for_status()
+        except aiohttp.ClientResponseError as http_err:
+            return None, f"HTTP error occurred: {http_err}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == max_retries:
+                return None, f"Failed to fetch data after {max_retries} retries. Error: {e}"
+        await asyncio.sleep(retry_delay)
+        retry_delay *= 2  # Exponential increase in delay
+
+    return None, "Failed to fetch data after retries"
+
+@_uses_async_session
+async def find_attraction_info_async(identifier, identifier_type, api_key=None):
+    """
+    Asynchronous counterpart of 'find_attraction_info'. Takes the same arguments and returns the
+    same (DataFrame, error message) tuple, but can be awaited concurrently with other lookups.
+
+    Example:
+    >>> attraction_df, error_message = await find_attraction_info_async('Taylor Swift', 'name', 'YOUR_API_KEY')
+    """
+    if identifier_type not in ['name', 'id']:
+        raise ValueError("Invalid identifier type. Must be 'name' or 'id'.")
+
+    if not identifier:
+        return _attractions_frame([]), "Identifier cannot be empty."
+
+    link, params = _attraction_request(identifier, identifier_type, _resolve_api_key(api_key))
+    data, error_message = await _get_json_async(link, params=params)
+    if error_message is not None:
+        return _attractions_frame([]), error_message
+    try:
+        records, error_message = parse_attraction_data(data, identifier, identifier_type)
+    except Exception as err:
+        return _attractions_frame([]), f"Other error occurred: {err}"
+    return _attractions_frame(records), error_message
+
+@_uses_async_session
+async def get_performer_events_1_async(attraction_id, api_key=None, max_retries=None):
+    """
+    Asynchronous counterpart of 'get_performer_events_1'. Takes the same arguments and returns the
+    same (DataFrame, error message) tuple.
+
+    Example:
+    >>> performer_events_df, error_message = await get_performer_events_1_async('K8vZ9175Tr0', 'YOUR_API_KEY')
+    """
+    params = {'apikey': _resolve_api_key(api_key), 'attractionId': attraction_id}
+    data, error_message = await _get_json_async(BASE_EVENTS, params=params, max_retries=max_retries)
+    if error_message is not None:
+        return _performer_events_frame([]), error_message
+    try:
+        rows, error_message = parse_performer_events_data(data)
+    except Exception as err:
+        return _performer_events_frame([]), f"Other error occurred: {err}"
+    return _performer_events_frame(rows), error_message
+
+@_uses_async_session
+async def fetch_filtered_events_async(api_key=None, start_date=None, end_date=None, city=None, state_code=None, country_code=None):
+    """
+    Asynchronous counterpart of 'fetch_filtered_events'. Takes the same arguments and returns the
+    same (DataFrame, error message) tuple. Pages after the first are gathered concurrently.
+
+    Example:
+    >>> events_df, error_message = await fetch_filtered_events_async('YOUR_API_KEY', city="New York")
+    """
+    params = {
+        'apikey': _resolve_api_key(api_key),
+        'startDateTime': start_date,
+        'endDateTime': end_date,
+        'city': city,
+        'stateCode': state_code,
+        'countryCode': country_code,
+        'size': EVENTS_PAGE_SIZE,
+        'page': 0
+    }
+    data, error_message = await _get_json_async(BASE_EVENTS, params=params)
+    if error_message is not None:
+        return _events_frame([], FILTERED_EVENT_COLUMNS), error_message
+
+    try:
+        pages = [data]
+        responses = await asyncio.gather(
+            *(_get_json_async(BASE_EVENTS, params={**params, 'page': page}) for page in range(1, _event_page_count(data)))
+        )
+        for page_data, error_message in responses:
+            if error_message is not None:
+                return _events_frame([], FILTERED_EVENT_COLUMNS), error_message
+            pages.append(page_data)
+
+        rows, error_message = parse_filtered_events_data(_merge_event_pages(pages))
+    except Exception as err:
+        return _events_frame([], FILTERED_EVENT_COLUMNS), f"Other error occurred: {err}"
+    return _events_frame(rows, FILTERED_EVENT_COLUMNS), error_message
+
+@_uses_async_session
+async def fetch_many(identifiers, identifier_type, api_key=None):
+    """
+    Looks up several attractions concurrently, so the total wait is roughly one round-trip
+    instead of one round-trip per identifier.
+
+    Args:
+    identifiers (iterable of str): Attraction names or IDs.
+    identifier_type (str): 'name' or 'id', applied to every identifier.
+    api_key (str, optional): API key for accessing the Ticketmaster API. Defaults to the CONSUMER_KEY
+                             loaded from 'key_for_TM.env'.
+
+    Returns:
+    list: One (DataFrame, error message) tuple per identifier, in the order given.
+
+    Example:
+    >>> results = asyncio.run(fetch_many(['Taylor Swift', 'Coldplay'], 'name', 'YOUR_API_KEY'))
+    """
+    return await asyncio.gather(
+        *(find_attraction_info_async(identifier, identifier_type, api_key) for identifier in identifiers)
+    )
@@ -2,14 +2,26 @@ from ticketmaster_anaylsis import *
 import pytest
 import pandas as pd
 import requests
-from unittest.mock import patch, Mock
+import asyncio
+import orjson
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import ticketmaster_anaylsis
+from unittest.mock import patch, Mock, MagicMock, AsyncMock
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_cache()
+    yield
+    clear_cache()
 
 # Test for successful data retrieval by name
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_find_attraction_info_success_name(mock_get):
     mock_response = Mock()
     expected_output = {'_embedded': {'attractions': [{'name': 'Test Attraction', 'id': '123'}]}}
-    mock_response.json.return_value = expected_output
+    mock_response.content = orjson.dumps(expected_output)
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -20,11 +32,11 @@ def test_find_attraction_info_success_name(mock_get):
     assert df.iloc[0]['ID'] == '123'
 
 # Test for successful data retrieval by ID
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_find_attraction_info_success_id(mock_get):
     mock_response = Mock()
     expected_output = {'name': 'Test Attraction', 'id': '123'}
-    mock_response.json.return_value = expected_output
+    mock_response.content = orjson.dumps(expected_output)
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -46,10 +58,10 @@ def test_find_attraction_info_empty_identifier():
     assert error == "Identifier cannot be empty."
 
 # Test for handling no matching attractions
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_find_attraction_info_no_match(mock_get):
     mock_response = Mock()
-    mock_response.json.return_value = {}
+    mock_response.content = orjson.dumps({})
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -58,26 +70,71 @@ def test_find_attraction_info_no_match(mock_get):
     assert error == "No matching attractions found."
 
 # Test for API rate limiting and retry mechanism
-@patch('ticketmaster_anaylsis.requests.get')
-def test_find_attraction_info_rate_limiting(mock_get):
-    mock_response = Mock()
-    # First call simulates a rate limit scenario, second call returns successful response
-    mock_response.side_effect = [
-        Mock(status_code=429),  # Rate limit response
-        Mock(status_code=200, json=lambda: {'_embedded': {'attractions': [{'name': 'Test Attraction', 'id': '123'}]}})
-    ]
-    mock_get.side_effect = mock_response.side_effect
+def test_session_retries_rate_limits():
+    retry = SESSION.get_adapter('https://app.ticketmaster.com').max_retries
+    assert retry.total == MAX_RETRIES
+    assert 429 in retry.status_forcelist
+    assert retry.respect_retry_after_header
+    assert retry.backoff_factor == 1
+
+def test_session_retries_rate_limit_then_succeeds():
+    statuses = [429, 200]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = statuses.pop(0)
+            body = orjson.dumps({'name': 'Test Attraction', 'id': '123'}) if status == 200 else b''
+            self.send_response(status)
+            self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        # Route plain HTTP through the Ticketmaster adapter so its Retry policy handles the 429
+        with patch.dict(SESSION.adapters, {'http://': SESSION.get_adapter('https://')}):
+            data, error = ticketmaster_anaylsis._get_json(f"http://127.0.0.1:{server.server_port}/attractions.json")
+    finally:
+        server.shutdown()
+        server.server_close()
 
-    df, error = find_attraction_info('Test Attraction', 'name', 'dummy_api_key')
     assert error is None
-    assert not df.empty
-    assert df.iloc[0]['name'] == 'Test Attraction'
+    assert data == {'name': 'Test Attraction', 'id': '123'}
+    assert statuses == []
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_get_performer_events_1_honors_max_retries(mock_get):
+    session = ticketmaster_anaylsis._session_with_retries(2)
+    response = Mock(status_code=200, content=orjson.dumps({'_embedded': {'events': [{'name': 'Event', 'id': 'E1'}]}}))
+
+    with patch.object(session, 'get', return_value=response) as session_get:
+        df, error = get_performer_events_1('attraction_id', 'dummy_api_key', max_retries=2)
+
+    assert error is None
+    assert df.iloc[0]['Event ID'] == 'E1'
+    assert session.get_adapter(BASE_EVENTS).max_retries.total == 2
+    session_get.assert_called_once()
+    mock_get.assert_not_called()
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_rate_limit_exhausted(mock_get):
+    mock_get.return_value = Mock(status_code=429)
+
+    df, error = find_attraction_info('Test Attraction', 'name', 'dummy_api_key')
+    assert df.empty
+    assert error == "Rate limit exceeded, try again later."
+    assert mock_get.call_count == 1
 
     
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_get_performer_events_no_events(mock_get):
     mock_response = Mock()
-    mock_response.json.return_value = {}
+    mock_response.content = orjson.dumps({})
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -85,20 +142,18 @@ def test_get_performer_events_no_events(mock_get):
     assert df.empty
     assert error == "No events found for this performer."
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_get_performer_events_rate_limiting(mock_get):
-    mock_response_rate_limit = Mock(status_code=429)
-    mock_response_success = Mock(status_code=200, json=lambda: {'_embedded': {'events': [{}]}})
-    mock_get.side_effect = [mock_response_rate_limit, mock_response_success]
+    mock_get.return_value = Mock(status_code=429)
 
     df, error = get_performer_events_1('attraction_id', 'api_key')
-    assert not df.empty
-    assert error is None
+    assert df.empty
+    assert error == "Rate limit exceeded, try again later."
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_get_performer_events_correct_data_parsing(mock_get):
     mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         '_embedded': {
             'events': [
                 {
@@ -128,7 +183,7 @@ def test_get_performer_events_correct_data_parsing(mock_get):
                 }
             ]
         }
-    }
+    })
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -143,10 +198,10 @@ def test_get_performer_events_correct_data_parsing(mock_get):
     assert df.iloc[0]['City'] == 'Landgraaf'
     assert df.iloc[0]['Country'] == 'Netherlands'
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_get_performer_events_venue_data_extraction(mock_get):
     mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         '_embedded': {
             'events': [
                 {
@@ -174,7 +229,7 @@ def test_get_performer_events_venue_data_extraction(mock_get):
                 }
             ]
         }
-    }
+    })
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -187,7 +242,7 @@ def test_get_performer_events_venue_data_extraction(mock_get):
     assert df.iloc[0]['Country'] == 'Netherlands'
     assert df.iloc[0]['Venue ID'] == 'Z598xZbpZee11'  # Assuming 'Venue ID' is a field you want to include
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_get_performer_events_http_error(mock_get):
     mock_response = Mock()
     mock_response.raise_for_status.side_effect = requests.HTTPError("500 Server Error: Internal Server Error for url")
@@ -198,10 +253,10 @@ def test_get_performer_events_http_error(mock_get):
     assert df.empty
     assert "HTTP error occurred: 500 Server Error: Internal Server Error for url" in error
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_get_performer_events_malformed_response(mock_get):
     mock_response = Mock()
-    mock_response.json.return_value = {"malformed_data": "data"}  # An unexpected format
+    mock_response.content = orjson.dumps({"malformed_data": "data"})  # An unexpected format
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -209,32 +264,433 @@ def test_get_performer_events_malformed_response(mock_get):
     assert df.empty
     assert "No events found for this performer." in error
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_fetch_filtered_events_no_events(mock_get):
     mock_response = Mock()
-    mock_response.json.return_value = {}  # No events in response
+    mock_response.content = orjson.dumps({})  # No events in response
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
-    df, error = fetch_filtered_events(api_key, city="Nonexistent City")
+    df, error = fetch_filtered_events('dummy_api_key', city="Nonexistent City")
     assert df.empty
     assert error == "No events found for the given criteria."
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_fetch_filtered_events_http_error(mock_get):
     mock_response = Mock()
     mock_response.raise_for_status.side_effect = requests.HTTPError("500 Server Error: Internal Server Error for url")
     mock_response.status_code = 500
     mock_get.return_value = mock_response
 
-    df, error = fetch_filtered_events(api_key, city="New York")
+    df, error = fetch_filtered_events('dummy_api_key', city="New York")
     assert df.empty
     assert "HTTP error occurred: 500 Server Error: Internal Server Error for url" in error
 
-@patch('ticketmaster_anaylsis.requests.get')
+@patch('ticketmaster_anaylsis.SESSION.get')
 def test_fetch_filtered_events_network_issues(mock_get):
     mock_get.side_effect = requests.exceptions.ConnectionError
 
-    df, error = fetch_filtered_events(api_key, city="New York")
+    df, error = fetch_filtered_events('dummy_api_key', city="New York")
+    assert df.empty
+    assert "Failed to fetch data after 5 retries." in error
+
+def mock_async_session(*payloads, status=200):
+    statuses = status if isinstance(status, (list, tuple)) else [status] * len(payloads)
+    session = MagicMock()
+    responses = []
+    for payload, status in zip(payloads, statuses):
+        response = MagicMock(status=status, headers={})
+        response.read = AsyncMock(return_value=orjson.dumps(payload))
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        responses.append(context)
+    session.get.side_effect = responses
+    return session
+
+def test_find_attraction_info_async_success_name():
+    session = mock_async_session({'_embedded': {'attractions': [{'name': 'Test Attraction', 'id': '123'}]}})
+    with patch('ticketmaster_anaylsis._get_session', return_value=session):
+        df, error = asyncio.run(find_attraction_info_async('Test Attraction', 'name', 'dummy_api_key'))
+    assert error is None
+    assert df.iloc[0]['ID'] == '123'
+
+def test_get_json_async_retries_server_errors():
+    session = mock_async_session({}, {'name': 'Test Attraction', 'id': '123'}, status=[503, 200])
+    with patch('ticketmaster_anaylsis._get_session', return_value=session), \
+         patch('ticketmaster_anaylsis.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+        df, error = asyncio.run(find_attraction_info_async('123', 'id', 'dummy_api_key'))
+    assert error is None
+    assert df.iloc[0]['ID'] == '123'
+    assert session.get.call_count == 2
+    mock_sleep.assert_awaited_once()
+
+@pytest.mark.parametrize('max_retries, requests_made', [(None, MAX_RETRIES + 1), (0, 1), (2, 3)])
+def test_get_performer_events_1_async_counts_retries_like_sync(max_retries, requests_made):
+    session = mock_async_session(*[{}] * requests_made, status=429)
+    with patch('ticketmaster_anaylsis._get_session', return_value=session), \
+         patch('ticketmaster_anaylsis.asyncio.sleep', new=AsyncMock()):
+        df, error = asyncio.run(get_performer_events_1_async('attraction_id', 'dummy_api_key', max_retries=max_retries))
+    assert df.empty
+    assert error == "Rate limit exceeded, try again later."
+    assert session.get.call_count == requests_made
+
+def test_fetch_many_reports_non_json_body():
+    session = mock_async_session({'name': 'First', 'id': '1'}, {})
+    contexts = list(session.get.side_effect)
+    contexts[1].__aenter__.return_value.read = AsyncMock(return_value=b'<html>Bad Gateway</html>')
+    session.get.side_effect = contexts
+    with patch('ticketmaster_anaylsis._get_session', return_value=session):
+        results = asyncio.run(fetch_many(['1', '2'], 'id', 'dummy_api_key'))
+    assert results[0][0].iloc[0]['name'] == 'First'
+    assert results[1][0].empty
+    assert results[1][1].startswith("Other error occurred:")
+
+def test_fetch_many_preserves_order():
+    session = mock_async_session(
+        {'name': 'First', 'id': '1'},
+        {'name': 'Second', 'id': '2'},
+    )
+    with patch('ticketmaster_anaylsis._get_session', return_value=session):
+        results = asyncio.run(fetch_many(['1', '2'], 'id', 'dummy_api_key'))
+    assert [df.iloc[0]['name'] for df, error in results] == ['First', 'Second']
+
+def test_async_entry_points_close_their_session():
+    sessions = []
+
+    async def fake_get_json(url, params=None, max_retries=None):
+        sessions.append(ticketmaster_anaylsis._get_session())
+        return {'name': 'Test Attraction', 'id': '123'}, None
+
+    with patch('ticketmaster_anaylsis._get_json_async', new=fake_get_json):
+        asyncio.run(fetch_many(['1', '2'], 'id', 'dummy_api_key'))
+
+    assert sessions[0] is sessions[1]
+    assert sessions[0].closed
+
+def test_fetch_filtered_events_async_drops_empty_params():
+    session = mock_async_session({})
+    with patch('ticketmaster_anaylsis._get_session', return_value=session):
+        df, error = asyncio.run(fetch_filtered_events_async('dummy_api_key', city="New York"))
+    assert error == "No events found for the given criteria."
+    assert session.get.call_args.kwargs['params'] == {'apikey': 'dummy_api_key', 'city': 'New York', 'size': 200, 'page': 0}
+
+def test_rate_limiter_pauses_on_exhausted_quota():
+    async def run():
+        limiter = ticketmaster_anaylsis._RateLimiter(2)
+        limiter.update({'X-RateLimit-Remaining': '0'})
+        with patch('ticketmaster_anaylsis.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            async with limiter:
+                pass
+        return mock_sleep
+
+    mock_sleep = asyncio.run(run())
+    mock_sleep.assert_awaited_once()
+    assert 0 < mock_sleep.await_args.args[0] <= 1.0
+
+def test_rate_limiter_honors_retry_after():
+    limiter = ticketmaster_anaylsis._RateLimiter(2)
+    limiter.update({'Retry-After': '3'})
+    assert limiter._resume_at - time.monotonic() > 2
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_uses_redis_cache(mock_get):
+    fake_redis = FakeRedis()
+    mock_get.return_value = Mock(status_code=200, headers={}, content=orjson.dumps({'name': 'Cached Attraction', 'id': 'L2'}))
+
+    with patch('ticketmaster_anaylsis._get_redis_client', return_value=fake_redis):
+        find_attraction_info('L2', 'id', 'first_key')
+        df, error = find_attraction_info('L2', 'id', 'second_key')
+
+    assert mock_get.call_count == 1
+    assert list(fake_redis.store) == ['attractions:id:L2']
+    assert error is None
+    assert df.iloc[0]['name'] == 'Cached Attraction'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_cache_ignores_api_key(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'name': 'Test Attraction', 'id': '123'}))
+
+    find_attraction_info('123', 'id', 'first_key')
+    df, error = find_attraction_info('123', 'id', 'rotated_key')
+
+    assert mock_get.call_count == 1
+    assert mock_get.call_args.kwargs['params']['apikey'] == 'first_key'
+    assert df.iloc[0]['ID'] == '123'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_get_performer_events_is_cached(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'_embedded': {'events': [{'name': 'Cached Event'}]}}))
+
+    get_performer_events_1('attraction_id', 'api_key')
+    df, error = get_performer_events_1('attraction_id', 'another_key')
+
+    assert mock_get.call_count == 1
+    assert df.iloc[0]['Event Name'] == 'Cached Event'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_fetch_filtered_events_caches_only_successes(mock_get):
+    mock_get.side_effect = [
+        Mock(status_code=200, content=orjson.dumps({})),
+        Mock(status_code=200, content=orjson.dumps({'_embedded': {'events': [{'id': 'E1'}]}})),
+    ]
+
+    _, first_error = fetch_filtered_events('dummy_api_key', city="Chicago")
+    df, error = fetch_filtered_events('dummy_api_key', city="Chicago")
+    cached_df, cached_error = fetch_filtered_events('dummy_api_key', city="Chicago")
+
+    assert first_error == "No events found for the given criteria."
+    assert mock_get.call_count == 2
+    assert error is None and cached_error is None
+    assert cached_df.iloc[0]['ID'] == 'E1'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attractions_bulk_by_name(mock_get):
+    attractions = {
+        'Taylor Swift': [{'name': 'Taylor Swift', 'id': '1'}],
+        'Coldplay': [{'name': 'Coldplay', 'id': '2'}, {'name': 'Coldplay Tribute', 'id': '3'}],
+    }
+    mock_get.side_effect = lambda link, params=None, **kwargs: Mock(
+        status_code=200, content=orjson.dumps({'_embedded': {'attractions': attractions[params['keyword']]}})
+    )
+
+    results, error = find_attractions_bulk(['Taylor Swift', 'Coldplay', 'Coldplay'], 'name', 'dummy_api_key')
+
+    assert mock_get.call_count == 2
+    assert sorted(call.kwargs['params']['keyword'] for call in mock_get.call_args_list) == ['Coldplay', 'Taylor Swift']
+    assert error is None
+    assert list(results['Taylor Swift']['ID']) == ['1']
+    assert list(results['Coldplay']['ID']) == ['2', '3']
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attractions_bulk_by_id(mock_get):
+    mock_get.side_effect = lambda link, params=None, **kwargs: Mock(
+        status_code=200, content=orjson.dumps({'name': 'Attraction ' + link.rsplit('/', 1)[1].split('.')[0], 'id': 'x'})
+    )
+
+    results, error = find_attractions_bulk(['A1', 'B2'], 'id', 'dummy_api_key')
+
+    assert error is None
+    assert results['A1'].iloc[0]['name'] == 'Attraction A1'
+    assert results['B2'].iloc[0]['name'] == 'Attraction B2'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attractions_bulk_reports_partial_failures(mock_get):
+    mock_get.side_effect = lambda link, params=None, **kwargs: Mock(
+        status_code=200 if 'A1' in link else 404, content=orjson.dumps({'name': 'Attraction A1', 'id': 'A1'})
+    )
+
+    results, error = find_attractions_bulk(['A1', 'B2'], 'id', 'dummy_api_key')
+
+    assert results['A1'].iloc[0]['ID'] == 'A1'
+    assert results['B2'].empty
+    assert error == "B2: Error fetching data: Status code 404"
+
+def test_extract_event_info_matches_event_columns():
+    row = extract_event_info({'name': 'Event', 'id': 'E1', 'priceRanges': [{'min': 10.0, 'max': 30.0}]})
+    assert len(row) == len(EVENT_COLUMNS)
+    assert row.event_name == 'Event'
+    assert row.max_price == 30.0
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_encodes_name_as_param(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'_embedded': {'attractions': [{'name': 'Simon & Garfunkel', 'id': 'SG'}]}}))
+
+    df, error = find_attraction_info('Simon & Garfunkel', 'name', 'dummy_api_key')
+
+    assert mock_get.call_args.args[0] == BASE_ATTRACTIONS + '.json'
+    assert mock_get.call_args.kwargs['params'] == {'keyword': 'Simon & Garfunkel', 'apikey': 'dummy_api_key'}
+    assert df.iloc[0]['ID'] == 'SG'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_get_performer_events_records_returns_rows(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'_embedded': {'events': [{'name': 'Row Event', 'id': 'R1'}]}}))
+
+    rows, error = get_performer_events_records('attraction_id', 'dummy_api_key')
+
+    assert error is None
+    assert isinstance(rows, list)
+    assert rows[0].event_name == 'Row Event'
+    assert rows[0].event_id == 'R1'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_records_returns_rows(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'name': 'Test Attraction', 'id': '123'}))
+
+    records, error = find_attraction_info_records('123', 'id', 'dummy_api_key')
+
+    assert error is None
+    assert records == [AttractionRow('Test Attraction', '123', 0, 0)]
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_fetch_filtered_events_reads_all_pages(mock_get):
+    def page_response(url, params=None, **kwargs):
+        page = params['page']
+        return Mock(status_code=200, content=orjson.dumps({
+            '_embedded': {'events': [{'id': f'P{page}'}]},
+            'page': {'totalPages': 3, 'number': page}
+        }))
+    mock_get.side_effect = page_response
+
+    df, error = fetch_filtered_events('dummy_api_key', city="Boston")
+
+    assert error is None
+    assert mock_get.call_count == 3
+    assert list(df['ID']) == ['P0', 'P1', 'P2']
+
+def test_fetch_filtered_events_async_reads_all_pages():
+    session = mock_async_session(
+        {'_embedded': {'events': [{'id': 'P0'}]}, 'page': {'totalPages': 2}},
+        {'_embedded': {'events': [{'id': 'P1'}]}, 'page': {'totalPages': 2}},
+    )
+    with patch('ticketmaster_anaylsis._get_session', return_value=session):
+        df, error = asyncio.run(fetch_filtered_events_async('dummy_api_key', city="Boston"))
+    assert error is None
+    assert list(df['ID']) == ['P0', 'P1']
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_api_key_defaults_to_environment(mock_get, monkeypatch):
+    monkeypatch.setenv('CONSUMER_KEY', 'env_api_key')
+    ticketmaster_anaylsis._default_api_key.cache_clear()
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({}))
+
+    try:
+        get_performer_events_1('attraction_id')
+    finally:
+        ticketmaster_anaylsis._default_api_key.cache_clear()
+
+    assert mock_get.call_args.kwargs['params']['apikey'] == 'env_api_key'
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_get_performer_events_price_columns_are_float(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'_embedded': {'events': [
+        {'name': 'Priced', 'priceRanges': [{'min': 10, 'max': 30}]},
+        {'name': 'Unpriced'},
+    ]}}))
+
+    df, error = get_performer_events_1('attraction_id', 'dummy_api_key')
+
+    assert error is None
+    assert list(df.columns) == list(EVENT_COLUMNS) + ['Average Price']
+    assert df['Min Price'].dtype == 'float64'
+    assert df['Max Price'].iloc[0] == 30.0
+    assert pd.isna(df['Max Price'].iloc[1])
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_get_performer_events_average_price_includes_free_events(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'_embedded': {'events': [
+        {'name': 'Free', 'priceRanges': [{'min': 0, 'max': 0}]},
+        {'name': 'Paid', 'priceRanges': [{'min': 0, 'max': 50}]},
+        {'name': 'Min only', 'priceRanges': [{'min': 20}]},
+    ]}}))
+
+    df, error = get_performer_events_1('attraction_id', 'dummy_api_key')
+
+    assert error is None
+    assert df['Average Price'].iloc[0] == 0.0
+    assert df['Average Price'].iloc[1] == 25.0
+    assert pd.isna(df['Average Price'].iloc[2])
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_revalidates_stale_redis_entry(mock_get):
+    fake_redis = FakeRedis()
+    mock_get.side_effect = [
+        Mock(status_code=200, headers={'ETag': '"v1"'}, content=orjson.dumps({'name': 'Stale Attraction', 'id': 'S1'})),
+        Mock(status_code=304, headers={'ETag': '"v1"'}, content=b''),
+    ]
+
+    with patch('ticketmaster_anaylsis._get_redis_client', return_value=fake_redis), \
+         patch('ticketmaster_anaylsis.L2_CACHE_TTL', -1):  # Every entry is immediately stale
+        find_attraction_info('S1', 'id', 'dummy_api_key')
+        clear_cache()
+        df, error = find_attraction_info('S1', 'id', 'dummy_api_key')
+
+    assert error is None
+    assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+    assert df.iloc[0]['name'] == 'Stale Attraction'
+
+def test_session_accepts_brotli_responses():
+    pytest.importorskip('brotli')
+    assert 'br' in SESSION.headers['Accept-Encoding'].split(', ')
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_requests_use_default_timeout(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({}))
+
+    fetch_filtered_events('dummy_api_key', city="Denver")
+
+    assert mock_get.call_args.kwargs['timeout'] == ticketmaster_anaylsis._DEFAULT_TIMEOUT
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_fetch_filtered_events_timeout(mock_get):
+    mock_get.side_effect = requests.exceptions.ReadTimeout("Read timed out.")
+
+    df, error = fetch_filtered_events('dummy_api_key', city="Denver")
     assert df.empty
-    assert "Failed to fetch data after 5 attempts." in error
+    assert "Failed to fetch data after 5 retries." in error
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_does_not_cache_failures(mock_get):
+    unauthorized = Mock(status_code=401)
+    unauthorized.raise_for_status.side_effect = requests.HTTPError("401 Client Error: Unauthorized")
+    mock_get.side_effect = [
+        unauthorized,
+        Mock(status_code=200, content=orjson.dumps({'name': 'Test Attraction', 'id': '123'})),
+    ]
+
+    _, first_error = find_attraction_info('123', 'id', 'bad_key')
+    df, error = find_attraction_info('123', 'id', 'good_key')
+
+    assert "401" in first_error
+    assert error is None
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs['params']['apikey'] == 'good_key'
+    assert df.iloc[0]['ID'] == '123'
+
+@pytest.mark.parametrize('payload', [
+    [{'name': 'Event'}],
+    {'_embedded': None},
+    {'_embedded': {'events': [{'name': 'Event', 'id': 'E1'}, 'not an event']}},
+])
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_get_performer_events_malformed_payload(mock_get, payload):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps(payload))
+
+    df, error = get_performer_events_1('attraction_id', 'dummy_api_key')
+
+    assert df.empty
+    assert error.startswith("Other error occurred:")
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_find_attraction_info_malformed_payload(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps({'_embedded': {'attractions': [{'id': '123'}]}}))
+
+    df, error = find_attraction_info('Test Attraction', 'name', 'dummy_api_key')
+
+    assert df.empty
+    assert error.startswith("Other error occurred:")
+
+@patch('ticketmaster_anaylsis.SESSION.get')
+def test_fetch_filtered_events_malformed_payload(mock_get):
+    mock_get.return_value = Mock(status_code=200, content=orjson.dumps([]))
+
+    df, error = fetch_filtered_events('dummy_api_key', city="Denver")
+
+    assert df.empty
+    assert error.startswith("Other error occurred:")
+
+@pytest.mark.parametrize('price_ranges', [[], None])
+def test_extract_event_info_without_price_ranges(price_ranges):
+    row = extract_event_info({'name': 'Event', 'id': 'E1', 'priceRanges': price_ranges})
+    assert row.min_price is None
+    assert row.max_price is None